@@ -11,17 +11,50 @@ Features:
 
 import os
 import re
+import atexit
 import logging
+import queue
+import time
 from datetime import datetime
 from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
 
-from flask import Flask, jsonify, request, session as flask_session, send_from_directory
+import orjson
+from flask import Flask, current_app, g, jsonify, request, session as flask_session, send_from_directory
+from flask_caching import Cache
+from flask_compress import Compress
 from flask_cors import CORS
+from flask.json.provider import DefaultJSONProvider
+from flask.logging import default_handler
+from sqlalchemy import exists, select
 from sqlalchemy.exc import OperationalError, IntegrityError
+from sqlalchemy.orm import raiseload, selectinload
 from werkzeug.security import check_password_hash, generate_password_hash
 
 from config import config
-from models import db, User, Session, SessionStatus, Feedback
+from models import db, User, UserRole, Session, SessionStatus, Feedback, compute_average_rating
+
+
+cache = Cache()
+
+
+# JSON SERIALIZATION
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson instead of the stdlib json module"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default),
+            mimetype=self.mimetype,
+        )
 
 
 # LOGGING CONFIGURATION
@@ -53,9 +86,18 @@ def setup_logging(app):
     )
     console_handler.setFormatter(console_formatter)
     
-    # Configure app logger
-    app.logger.addHandler(file_handler)
-    app.logger.addHandler(console_handler)
+    # Write records from a background thread so requests never block on log I/O
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # Configure app logger (drop Flask's synchronous stderr handler, which it
+    # attaches on first access to app.logger and would duplicate console output)
+    app.logger.removeHandler(default_handler)
+    app.logger.addHandler(QueueHandler(log_queue))
     app.logger.setLevel(log_level)
     
     app.logger.info("="*60)
@@ -67,8 +109,69 @@ def setup_logging(app):
     app.logger.info("="*60)
 
 
+# VALIDATION PATTERNS
+
+_RE_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Anything InnoDB's FULLTEXT parser splits words on (including the boolean operators)
+_RE_FULLTEXT_SEPARATORS = re.compile(r'\W+')
+
+
+# SEARCH
+
+# Shortest word InnoDB indexes for FULLTEXT (innodb_ft_min_token_size default)
+FULLTEXT_MIN_WORD_LENGTH = 3
+
+
+def fulltext_query(search):
+    """
+    Build a MySQL boolean-mode query requiring every search word as a prefix
+    
+    Returns None when a word is too short for the FULLTEXT index, so the
+    caller can fall back to a LIKE search.
+    """
+    # Split the way the index tokenizes, so "full-stack" needs both "full" and "stack"
+    words = [word for word in _RE_FULLTEXT_SEPARATORS.split(search) if word]
+    if not words or any(len(word) < FULLTEXT_MIN_WORD_LENGTH for word in words):
+        return None
+    return " ".join(f"+{word}*" for word in words)
+
+
+# REQUEST PARSING
+
+def get_json_body():
+    """Return the request's JSON object body, or an empty dict if missing or malformed"""
+    data = request.get_json(silent=True)
+    return data if isinstance(data, dict) else {}
+
+
+def get_str(data, key, default="", strip=True):
+    """
+    Read a string field from a JSON body
+    
+    Missing or non-string values (null, numbers, lists) fall back to the default
+    instead of raising on .strip().
+    """
+    value = data.get(key, default)
+    if not isinstance(value, str):
+        return default
+    return value.strip() if strip else value
+
+
 # PASSWORD VALIDATION
 
+# Compared against on login when the email is unknown, to keep response time uniform
+_DUMMY_PASSWORD_HASH = generate_password_hash(
+    "not-a-real-password", method=config.PASSWORD_HASH_METHOD
+)
+
+# Canonical "method:params" prefix Werkzeug writes for the configured method
+_PASSWORD_HASH_PREFIX = _DUMMY_PASSWORD_HASH.split("$", 1)[0]
+
+
+def password_needs_rehash(password_hash):
+    """Check whether a stored hash was made with a different method or cost than configured"""
+    return password_hash.split("$", 1)[0] != _PASSWORD_HASH_PREFIX
+
 def validate_password(password):
     """
     Validate password strength
@@ -88,13 +191,25 @@ def validate_password(password):
     if len(password) < config.PASSWORD_MIN_LENGTH:
         return False, f"Password must be at least {config.PASSWORD_MIN_LENGTH} characters long"
     
-    if not re.search(r"[A-Z]", password):
+    # Single pass over the password, stopping once every class has been seen
+    has_upper = has_lower = has_digit = False
+    for ch in password:
+        if "A" <= ch <= "Z":
+            has_upper = True
+        elif "a" <= ch <= "z":
+            has_lower = True
+        elif ch.isdecimal():
+            has_digit = True
+        if has_upper and has_lower and has_digit:
+            break
+    
+    if not has_upper:
         return False, "Password must contain at least one uppercase letter"
     
-    if not re.search(r"[a-z]", password):
+    if not has_lower:
         return False, "Password must contain at least one lowercase letter"
     
-    if not re.search(r"\d", password):
+    if not has_digit:
         return False, "Password must contain at least one number"
     
     return True, None
@@ -114,15 +229,24 @@ def create_app():
     # Load configuration
     app.config.from_object(config)
     
+    # Use orjson for jsonify() and request.get_json()
+    app.json = OrjsonProvider(app)
+    
     # Setup logging
     setup_logging(app)
     
     # Initialize database
     db.init_app(app)
     
+    # Initialize response cache
+    cache.init_app(app)
+    
     # Enable CORS (allow frontend to send cookies)
     CORS(app, supports_credentials=True)
     
+    # Gzip JSON, HTML, CSS and JS responses
+    Compress(app)
+    
     # Create database tables
     with app.app_context():
         try:
@@ -165,11 +289,124 @@ def login_required(fn):
 
 
 def get_current_user():
-    """Get the currently authenticated user"""
+    """Get the currently authenticated user (loaded once per request)"""
+    if "current_user" in g:
+        return g.current_user
     user_id = flask_session.get("user_id")
-    if not user_id:
+    g.current_user = db.session.get(User, user_id) if user_id else None
+    return g.current_user
+
+
+# RESPONSE CACHING
+
+# Covers every cached payload that embeds user profiles or ratings
+# (user listings and per-user feedback)
+USERS_CACHE_VERSION_KEY = "users:version"
+
+# In-process caches (SimpleCache) prune never-expiring keys first once they fill
+# up, which would reset a stamp stored there to 0 and revive old entries. For
+# those the stamp lives in this process instead; Redis keeps it shared.
+_USERS_CACHE_VERSION_IN_PROCESS = "redis" not in config.CACHE_TYPE.lower()
+_users_cache_version = 0
+
+
+def cache_get(key):
+    """Read a cached value, treating a cache backend error as a miss"""
+    try:
+        return cache.get(key)
+    except Exception as e:
+        current_app.logger.error(f"Cache read failed for '{key}': {str(e)}")
         return None
-    return User.query.get(user_id)
+
+
+def cache_set(key, value, timeout=None):
+    """Store a value in the cache, logging (not raising) a cache backend error"""
+    try:
+        cache.set(key, value, timeout=timeout)
+    except Exception as e:
+        current_app.logger.error(f"Cache write failed for '{key}': {str(e)}")
+
+
+def users_cache_version():
+    """Current version stamp for cached user listings"""
+    if _USERS_CACHE_VERSION_IN_PROCESS:
+        return _users_cache_version
+    return cache_get(USERS_CACHE_VERSION_KEY) or 0
+
+
+def invalidate_users_cache():
+    """Replace the version stamp so every cached user listing is ignored"""
+    global _users_cache_version
+    if _USERS_CACHE_VERSION_IN_PROCESS:
+        _users_cache_version = time.time_ns()
+    else:
+        cache_set(USERS_CACHE_VERSION_KEY, time.time_ns(), timeout=0)
+
+
+def conditional_json(payload):
+    """Build a JSON response with an ETag, answering 304 if the client copy is current"""
+    response = jsonify(payload)
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+# PAGINATION
+
+MAX_PAGE_SIZE = 100
+
+
+def parse_page_args():
+    """
+    Parse optional keyset pagination arguments (?limit=&cursor=)
+    
+    Pagination is opt-in: without a limit the full result set is returned.
+    
+    Returns:
+        tuple: (limit: int or None, cursor: tuple or None, error_message: str or None)
+    """
+    limit = request.args.get("limit", "").strip()
+    cursor = request.args.get("cursor", "").strip()
+    
+    if not limit:
+        return None, None, None
+    
+    try:
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    except ValueError:
+        return None, None, "Invalid limit"
+    
+    if not cursor:
+        return limit, None, None
+    
+    try:
+        created_at, row_id = cursor.rsplit("|", 1)
+        return limit, (datetime.fromisoformat(created_at), int(row_id)), None
+    except ValueError:
+        return None, None, "Invalid cursor"
+
+
+def apply_page(query, model, limit, cursor):
+    """Order newest first and restrict the query to the requested page"""
+    if cursor:
+        created_at, row_id = cursor
+        query = query.filter(
+            (model.created_at < created_at) |
+            ((model.created_at == created_at) & (model.id < row_id))
+        )
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+    if limit:
+        # Fetch one extra row to know whether another page exists
+        query = query.limit(limit + 1)
+    return query
+
+
+def split_page(rows, limit):
+    """Trim the extra row fetched by apply_page and build the next cursor"""
+    if not limit or len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, f"{last.created_at.isoformat()}|{last.id}"
 
 
 # ROUTE REGISTRATION
@@ -184,26 +421,57 @@ def register_routes(app: Flask):
     @app.route("/")
     def index():
         """Serve the main application page"""
-        return send_from_directory(frontend_dir, "index.html")
+        # Always revalidate so new deploys are picked up (cheap 304 otherwise)
+        return send_from_directory(frontend_dir, "index.html", max_age=0)
     
     @app.route("/<path:filename>")
     def frontend_static(filename):
         """Serve frontend static files (CSS, JS, images)"""
-        return send_from_directory(frontend_dir, filename)
+        return send_from_directory(frontend_dir, filename, max_age=config.STATIC_MAX_AGE)
     
     # HEALTH CHECK
     
-    @app.route("/api/health", methods=["GET"])
-    def health():
-        """Health check endpoint to verify server and database status"""
+    HEALTH_CACHE_KEY = "health:db"
+    
+    def check_database():
+        """Run a live database check, returning (ok, error_message)"""
         try:
-            # Test database connection
-            db.session.execute(db.text("SELECT 1"))
+            # Check out a pooled connection directly (no ORM session needed)
+            with db.engine.connect() as connection:
+                connection.exec_driver_sql("SELECT 1")
             app.logger.info("Health check: OK")
-            return jsonify({"ok": True, "db": "up", "message": "Server is healthy"})
+            return True, None
         except Exception as e:
             app.logger.error(f"Health check failed: {str(e)}")
-            return jsonify({"ok": False, "db": "down", "error": str(e)}), 500
+            return False, str(e)
+    
+    def remember_health(state):
+        # timeout=0 means "never expire" to the cache, so a TTL of 0 or less
+        # disables caching instead of freezing the first result
+        if config.HEALTH_CHECK_CACHE_TIMEOUT > 0:
+            cache_set(HEALTH_CACHE_KEY, state, timeout=config.HEALTH_CHECK_CACHE_TIMEOUT)
+    
+    def health_response(ok, error):
+        if ok:
+            return jsonify({"ok": True, "db": "up", "message": "Server is healthy"})
+        return jsonify({"ok": False, "db": "down", "error": error}), 500
+    
+    @app.route("/api/health", methods=["GET"])
+    def health():
+        """Health check endpoint (database status is cached for a few seconds)"""
+        # A cache outage reads as a miss, so the check still reports the database
+        state = cache_get(HEALTH_CACHE_KEY) if config.HEALTH_CHECK_CACHE_TIMEOUT > 0 else None
+        if state is None:
+            state = check_database()
+            remember_health(state)
+        return health_response(*state)
+    
+    @app.route("/api/health/deep", methods=["GET"])
+    def health_deep():
+        """Uncached health check that always queries the database"""
+        state = check_database()
+        remember_health(state)
+        return health_response(*state)
     
      
     # AUTHENTICATION ROUTES
@@ -228,13 +496,13 @@ def register_routes(app: Flask):
             500: Server error
         """
         try:
-            data = request.get_json() or {}
+            data = get_json_body()
             
             # Extract and validate required fields
-            name = data.get("name", "").strip()
-            email = data.get("email", "").strip().lower()
-            password = data.get("password", "")
-            role = data.get("role", "mentee").strip().lower()
+            name = get_str(data, "name")
+            email = get_str(data, "email").lower()
+            password = get_str(data, "password", strip=False)
+            role = get_str(data, "role", UserRole.MENTEE).lower()
             
             # Validation
             if not name:
@@ -250,8 +518,7 @@ def register_routes(app: Flask):
                 return jsonify({"error": "Password is required"}), 400
             
             # Validate email format
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_pattern, email):
+            if not _RE_EMAIL.match(email):
                 app.logger.warning(f"Signup failed: Invalid email format: {email}")
                 return jsonify({"error": "Invalid email format"}), 400
             
@@ -262,37 +529,42 @@ def register_routes(app: Flask):
                 return jsonify({"error": error_msg}), 400
             
             # Check if email already exists
-            if User.query.filter_by(email=email).first():
+            if db.session.scalar(select(User.id).where(User.email == email)) is not None:
                 app.logger.warning(f"Signup failed: Email already registered: {email}")
                 return jsonify({"error": "Email already registered"}), 400
             
             # Validate role
-            if role not in {"mentor", "mentee", "both"}:
-                role = "mentee"
+            if role not in UserRole.ALL:
+                role = UserRole.MENTEE
             
             # Hash password
-            password_hash = generate_password_hash(password)
+            password_hash = generate_password_hash(password, method=config.PASSWORD_HASH_METHOD)
             
             # Create user
             user = User(
                 name=name,
                 email=email,
                 password_hash=password_hash,
-                bio=data.get("bio", ""),
-                interests=data.get("interests", ""),
-                skills=data.get("skills", ""),
+                bio=get_str(data, "bio"),
+                interests=get_str(data, "interests"),
+                skills=get_str(data, "skills"),
                 role=role,
             )
             
+            # Serialize after the INSERT but before commit, so the response
+            # does not need to reload the expired row
             db.session.add(user)
+            db.session.flush()
+            user_data = user.to_dict_basic()
             db.session.commit()
+            invalidate_users_cache()
             
             # Auto-login after signup
-            flask_session["user_id"] = user.id
+            flask_session["user_id"] = user_data["id"]
             
-            app.logger.info(f" User registered successfully: {email} (ID: {user.id})")
+            app.logger.info(f" User registered successfully: {email} (ID: {user_data['id']})")
             
-            return jsonify({"user": user.to_dict_basic(), "message": "Account created successfully"}), 201
+            return jsonify({"user": user_data, "message": "Account created successfully"}), 201
             
         except IntegrityError as e:
             db.session.rollback()
@@ -318,10 +590,10 @@ def register_routes(app: Flask):
             401: Invalid credentials
         """
         try:
-            data = request.get_json() or {}
+            data = get_json_body()
             
-            email = data.get("email", "").strip().lower()
-            password = data.get("password", "")
+            email = get_str(data, "email").lower()
+            password = get_str(data, "password", strip=False)
             
             # Validation
             if not email or not password:
@@ -329,13 +601,30 @@ def register_routes(app: Flask):
                 return jsonify({"error": "Email and password are required"}), 400
             
             # Find user
-            user = User.query.filter_by(email=email).first()
-            
-            # Check credentials
-            if not user or not check_password_hash(user.password_hash, password):
+            user = db.session.execute(
+                select(User).where(User.email == email)
+            ).scalar_one_or_none()
+            
+            # Check credentials (always run a hash check so a missing user
+            # takes as long as a wrong password)
+            password_hash = user.password_hash if user else _DUMMY_PASSWORD_HASH
+            password_ok = check_password_hash(password_hash, password)
+            if not user or not password_ok:
                 app.logger.warning(f"Login failed: Invalid credentials for {email}")
                 return jsonify({"error": "Invalid email or password"}), 401
             
+            # Upgrade hashes made with an older method/cost while we have the password
+            if password_needs_rehash(user.password_hash):
+                try:
+                    user.password_hash = generate_password_hash(
+                        password, method=config.PASSWORD_HASH_METHOD
+                    )
+                    db.session.commit()
+                    app.logger.info(f"Password hash upgraded for User ID {user.id}")
+                except Exception as e:
+                    db.session.rollback()
+                    app.logger.warning(f"Password rehash failed for User ID {user.id}: {str(e)}")
+            
             # Create session
             flask_session["user_id"] = user.id
             
@@ -391,22 +680,23 @@ def register_routes(app: Flask):
         
         # PUT - Update profile
         try:
-            data = request.get_json() or {}
+            data = get_json_body()
             
             # Update fields
-            if "name" in data and data["name"].strip():
-                user.name = data["name"].strip()
+            name = get_str(data, "name")
+            if name:
+                user.name = name
             
             if "bio" in data:
-                user.bio = data["bio"].strip()
+                user.bio = get_str(data, "bio")
             
             if "interests" in data:
-                user.interests = data["interests"].strip()
+                user.interests = get_str(data, "interests")
             
             if "skills" in data:
-                user.skills = data["skills"].strip()
+                user.skills = get_str(data, "skills")
 
-            if "experience_years" in data and user.role in ("mentor", "both"):
+            if "experience_years" in data and user.role in UserRole.CAN_MENTOR:
                 try:
                     val = data.get("experience_years")
                     if val is None or val == "":
@@ -417,11 +707,12 @@ def register_routes(app: Flask):
                     user.experience_years = None
             
             if "role" in data:
-                role = data["role"].strip().lower()
-                if role in {"mentor", "mentee", "both"}:
+                role = get_str(data, "role").lower()
+                if role in UserRole.ALL:
                     user.role = role
             
             db.session.commit()
+            invalidate_users_cache()
             
             app.logger.info(f"Profile updated: User ID {user.id}")
             
@@ -444,63 +735,82 @@ def register_routes(app: Flask):
             - q: Search query (searches name, interests, skills)
             - role: Filter by role (mentor, mentee, both)
             - show_all: If true, show all users (default: only mentor/both)
+            - limit: Optional page size (max 100)
+            - cursor: next_cursor value from the previous page
         
         Returns:
             List of users (excludes current user, emails hidden)
         """
         try:
             current_user = get_current_user()
-            query = User.query
+            current_user_id = current_user.id if current_user else None
             
-            # Filter by role
             role = request.args.get("role", "").strip().lower()
             show_all = request.args.get("show_all", "").lower() == "true"
+            search = request.args.get("q", "").strip()
+            
+            limit, cursor, page_error = parse_page_args()
+            if page_error:
+                return jsonify({"error": page_error}), 400
             
-            if role in {"mentor", "mentee", "both"}:
+            # Serve repeat listings from the cache
+            cache_key = (
+                f"users:{users_cache_version()}:{current_user_id}:"
+                f"{role}:{show_all}:{search.lower()}:{limit}:{cursor}"
+            )
+            payload = cache_get(cache_key)
+            if payload is not None:
+                app.logger.info(f"Users query: Served {len(payload['users'])} users from cache (search: '{search}', role: '{role}')")
+                return conditional_json(payload)
+            
+            query = User.query
+            
+            # Filter by role
+            if role in UserRole.ALL:
                 query = query.filter(User.role == role)
             elif not show_all:
                 # Default: only show mentors and users who can mentor (both)
-                query = query.filter(User.role.in_(["mentor", "both"]))
+                query = query.filter(User.role.in_(UserRole.CAN_MENTOR))
             
-            # Search filter
-            search = request.args.get("q", "").strip()
+            # Search filter (FULLTEXT index on MySQL, LIKE scan otherwise)
             if search:
-                like_pattern = f"%{search}%"
-                query = query.filter(
-                    (User.name.ilike(like_pattern)) |
-                    (User.interests.ilike(like_pattern)) |
-                    (User.skills.ilike(like_pattern))
-                )
+                ft_query = fulltext_query(search) if db.engine.dialect.name == "mysql" else None
+                if ft_query:
+                    query = query.filter(db.text(
+                        "MATCH(name, interests, skills) AGAINST (:q IN BOOLEAN MODE)"
+                    ).bindparams(q=ft_query))
+                else:
+                    like_pattern = f"%{search}%"
+                    query = query.filter(
+                        (User.name.ilike(like_pattern)) |
+                        (User.interests.ilike(like_pattern)) |
+                        (User.skills.ilike(like_pattern))
+                    )
             
             # Exclude current user
-            if current_user:
-                query = query.filter(User.id != current_user.id)
+            if current_user_id:
+                query = query.filter(User.id != current_user_id)
             
             # Execute query
-            users = query.order_by(User.created_at.desc()).all()
+            users, next_cursor = split_page(apply_page(query, User, limit, cursor).all(), limit)
             
-            # Calculate average rating for each user
             users_data = []
             for user in users:
                 user_dict = user.to_dict_basic()
                 # Remove email for privacy (only show in profile)
                 user_dict.pop('email', None)
                 
-                # Calculate average rating
-                feedbacks = Feedback.query.filter_by(target_user_id=user.id).all()
-                if feedbacks:
-                    avg_rating = sum(f.rating for f in feedbacks) / len(feedbacks)
-                    user_dict['average_rating'] = round(avg_rating, 1)
-                    user_dict['total_reviews'] = len(feedbacks)
-                else:
-                    user_dict['average_rating'] = None
-                    user_dict['total_reviews'] = 0
+                user_dict['average_rating'] = user.average_rating
+                user_dict['total_reviews'] = user.rating_count
                 
                 users_data.append(user_dict)
             
+            payload = {"users": users_data, "next_cursor": next_cursor}
+            cache_set(cache_key, payload)
+            
             app.logger.info(f"Users query: Found {len(users_data)} users (search: '{search}', role: '{role}')")
             
-            return jsonify({"users": users_data})
+            return conditional_json(payload)
             
         except Exception as e:
             app.logger.error(f"Error listing users: {str(e)}")
@@ -517,14 +827,26 @@ def register_routes(app: Flask):
         if request.method == "GET":
             # Get sessions where user is requester or mentor
             try:
-                sessions = Session.query.filter(
+                limit, cursor, page_error = parse_page_args()
+                if page_error:
+                    return jsonify({"error": page_error}), 400
+                
+                query = Session.query.options(
+                    selectinload(Session.requester),
+                    selectinload(Session.mentor),
+                    raiseload("*"),  # Fail loudly on any relationship not loaded above
+                ).filter(
                     (Session.requester_id == user.id) |
                     (Session.mentor_id == user.id)
-                ).order_by(Session.created_at.desc()).all()
+                )
+                sessions, next_cursor = split_page(apply_page(query, Session, limit, cursor).all(), limit)
                 
                 app.logger.info(f"Sessions query: Found {len(sessions)} sessions for User ID {user.id}")
                 
-                return jsonify({"sessions": [s.to_dict() for s in sessions]})
+                return jsonify({
+                    "sessions": [s.to_dict() for s in sessions],
+                    "next_cursor": next_cursor,
+                })
                 
             except Exception as e:
                 app.logger.error(f"Error fetching sessions: {str(e)}")
@@ -532,13 +854,13 @@ def register_routes(app: Flask):
         
         # POST - Create new session request
         try:
-            data = request.get_json() or {}
+            data = get_json_body()
             
             mentor_id = data.get("mentor_id")
-            topic = data.get("topic", "").strip()
-            description = data.get("description", "").strip()
-            scheduled_time_str = data.get("scheduled_time")
-            meeting_link = data.get("meeting_link", "").strip()
+            topic = get_str(data, "topic")
+            description = get_str(data, "description")
+            scheduled_time_str = get_str(data, "scheduled_time")
+            meeting_link = get_str(data, "meeting_link")
             
             # Validation
             if not mentor_id or not topic:
@@ -549,34 +871,38 @@ def register_routes(app: Flask):
                 app.logger.warning(f"Session creation failed: User {user.id} tried to request themselves")
                 return jsonify({"error": "You cannot request yourself as a mentor"}), 400
             
-            # Check mentor exists
-            mentor = User.query.get(mentor_id)
-            if not mentor:
+            # Check mentor exists (only the role is needed)
+            mentor_role = db.session.scalar(select(User.role).where(User.id == mentor_id))
+            if mentor_role is None:
                 app.logger.warning(f"Session creation failed: Mentor ID {mentor_id} not found")
                 return jsonify({"error": "Mentor not found"}), 404
             
             #Validate mentor role
-            if mentor.role not in ["mentor", "both"]:
-                app.logger.warning(f"Session creation failed: User {mentor_id} is not a mentor (role: {mentor.role})")
+            if mentor_role not in UserRole.CAN_MENTOR:
+                app.logger.warning(f"Session creation failed: User {mentor_id} is not a mentor (role: {mentor_role})")
                 return jsonify({"error": "This user is not available as a mentor"}), 400
             
             # Check for duplicate pending/accepted sessions
-            existing_session = Session.query.filter(
+            has_duplicate = db.session.scalar(select(exists().where(
                 Session.requester_id == user.id,
                 Session.mentor_id == mentor_id,
                 Session.topic == topic,
                 Session.status.in_(["pending", "accepted"])
-            ).first()
+            )))
             
-            if existing_session:
-                app.logger.warning(f"Session creation failed: Duplicate session exists (ID: {existing_session.id})")
+            if has_duplicate:
+                app.logger.warning(f"Session creation failed: Duplicate session exists (Requester: {user.id}, Mentor: {mentor_id}, Topic: '{topic}')")
                 return jsonify({"error": "You already have a pending or accepted session with this mentor for this topic"}), 400
             
             # Parse scheduled time
             scheduled_time = None
             if scheduled_time_str:
                 try:
-                    scheduled_time = datetime.fromisoformat(scheduled_time_str)
+                    # Keep only what the DATETIME column stores (wall-clock time in
+                    # whole seconds, no offset) so the response matches later reads
+                    scheduled_time = datetime.fromisoformat(scheduled_time_str).replace(
+                        tzinfo=None, microsecond=0
+                    )
                 except ValueError:
                     app.logger.warning(f"Session creation failed: Invalid datetime format: {scheduled_time_str}")
                     return jsonify({"error": "Invalid scheduled_time format. Use ISO 8601 format."}), 400
@@ -591,12 +917,15 @@ def register_routes(app: Flask):
                 meeting_link=meeting_link,
             )
             
+            # Serialize before commit so the response does not reload the expired row
             db.session.add(session_obj)
+            db.session.flush()
+            session_data = session_obj.to_dict()
             db.session.commit()
             
-            app.logger.info(f"Session created: ID {session_obj.id}, Requester: {user.id}, Mentor: {mentor_id}")
+            app.logger.info(f"Session created: ID {session_data['id']}, Requester: {user.id}, Mentor: {mentor_id}")
             
-            return jsonify({"session": session_obj.to_dict(), "message": "Session request sent"}), 201
+            return jsonify({"session": session_data, "message": "Session request sent"}), 201
             
         except Exception as e:
             db.session.rollback()
@@ -609,11 +938,11 @@ def register_routes(app: Flask):
         """Update session status (accept/reject/complete) and optionally add meeting link"""
         try:
             user = get_current_user()
-            session_obj = Session.query.get_or_404(session_id)
+            session_obj = db.get_or_404(Session, session_id)
             
-            data = request.get_json() or {}
-            new_status = data.get("status")
-            meeting_link = data.get("meeting_link", "").strip()
+            data = get_json_body()
+            new_status = get_str(data, "status")
+            meeting_link = get_str(data, "meeting_link")
             
             # Validate status
             if new_status not in {SessionStatus.ACCEPTED, SessionStatus.REJECTED, SessionStatus.COMPLETED}:
@@ -668,7 +997,7 @@ def register_routes(app: Flask):
         """Create feedback for a completed session"""
         try:
             user = get_current_user()
-            session_obj = Session.query.get_or_404(session_id)
+            session_obj = db.get_or_404(Session, session_id)
             
             # Authorization check
             if user.id not in {session_obj.requester_id, session_obj.mentor_id}:
@@ -680,19 +1009,9 @@ def register_routes(app: Flask):
                 app.logger.warning(f"Feedback failed: Session {session_id} is not completed")
                 return jsonify({"error": "Feedback can only be given for completed sessions"}), 400
             
-            # Check if feedback already exists
-            existing_feedback = Feedback.query.filter_by(
-                session_id=session_id,
-                author_id=user.id
-            ).first()
-            
-            if existing_feedback:
-                app.logger.warning(f"Feedback failed: User {user.id} already left feedback for session {session_id}")
-                return jsonify({"error": "You have already left feedback for this session"}), 400
-            
-            data = request.get_json() or {}
+            data = get_json_body()
             rating = data.get("rating")
-            comment = data.get("comment", "").strip()
+            comment = get_str(data, "comment")
             
             # Validate rating
             try:
@@ -705,13 +1024,12 @@ def register_routes(app: Flask):
                 app.logger.warning(f"Feedback failed: Rating {rating} out of range")
                 return jsonify({"error": "Rating must be between 1 and 5"}), 400
             
-            # Determine target user (the other person in the session)
-            target_user_id = (
-                session_obj.mentor_id if user.id == session_obj.requester_id
-                else session_obj.requester_id
-            )
+            # Determine target user (the other person in the session).
+            # user.id is one of the two ids (checked above), and a ^ b ^ a == b.
+            target_user_id = session_obj.mentor_id ^ session_obj.requester_id ^ user.id
             
-            # Create feedback
+            # Create feedback (duplicates are rejected by the unique
+            # (session_id, author_id) constraint and handled below)
             feedback_obj = Feedback(
                 session_id=session_obj.id,
                 author_id=user.id,
@@ -721,15 +1039,25 @@ def register_routes(app: Flask):
             )
             
             db.session.add(feedback_obj)
+            
+            # Update the target's rating aggregates in the same transaction
+            User.query.filter_by(id=target_user_id).update({
+                User.rating_sum: User.rating_sum + rating,
+                User.rating_count: User.rating_count + 1,
+            }, synchronize_session=False)
+            
+            # Serialize before commit so the response does not reload the expired rows
+            feedback_data = feedback_obj.to_dict()
             db.session.commit()
+            invalidate_users_cache()
             
-            app.logger.info(f"Feedback created: ID {feedback_obj.id}, Session: {session_id}, Rating: {rating}")
+            app.logger.info(f"Feedback created: ID {feedback_data['id']}, Session: {session_id}, Rating: {rating}")
             
-            return jsonify({"feedback": feedback_obj.to_dict(), "message": "Feedback submitted successfully"}), 201
+            return jsonify({"feedback": feedback_data, "message": "Feedback submitted successfully"}), 201
             
         except IntegrityError:
             db.session.rollback()
-            app.logger.warning(f"Feedback failed: Duplicate feedback for session {session_id}")
+            app.logger.warning(f"Feedback failed: User {user.id} already left feedback for session {session_id}")
             return jsonify({"error": "You have already left feedback for this session"}), 400
         except Exception as e:
             db.session.rollback()
@@ -739,24 +1067,79 @@ def register_routes(app: Flask):
     @app.route("/api/users/<int:user_id>/feedback", methods=["GET"])
     @login_required
     def get_user_feedback(user_id):
-        """Get all feedback for a specific user"""
+        """Get feedback for a specific user (optionally paginated with ?limit=&cursor=)"""
         try:
-            # Check user exists
-            User.query.get_or_404(user_id)
+            limit, cursor, page_error = parse_page_args()
+            if page_error:
+                return jsonify({"error": page_error}), 400
+            
+            # Serve repeat views from the cache
+            cache_key = f"feedback:{users_cache_version()}:{user_id}:{limit}:{cursor}"
+            payload = cache_get(cache_key)
+            if payload is not None:
+                app.logger.info(f"Feedback query: Served {len(payload['feedback'])} reviews from cache for User {user_id}")
+                return conditional_json(payload)
             
             # Get feedback
-            feedback_items = Feedback.query.filter_by(
-                target_user_id=user_id
-            ).order_by(Feedback.created_at.desc()).all()
+            query = Feedback.query.options(
+                selectinload(Feedback.author).load_only(User.id, User.name, User.role),
+                selectinload(Feedback.target_user).load_only(User.id, User.name, User.role),
+                raiseload("*"),  # Fail loudly on any relationship not loaded above
+            ).filter_by(target_user_id=user_id)
+            feedback_items, next_cursor = split_page(apply_page(query, Feedback, limit, cursor).all(), limit)
+            
+            # Only an empty result needs a lookup to tell "no feedback yet" from a missing user
+            if not feedback_items and db.session.scalar(select(User.id).where(User.id == user_id)) is None:
+                app.logger.warning(f"Feedback query failed: User {user_id} not found")
+                return jsonify({"error": "User not found"}), 404
+            
+            payload = {
+                "feedback": [f.to_dict() for f in feedback_items],
+                "next_cursor": next_cursor,
+            }
+            cache_set(cache_key, payload)
             
             app.logger.info(f"Feedback query: Found {len(feedback_items)} reviews for User {user_id}")
             
-            return jsonify({"feedback": [f.to_dict() for f in feedback_items]})
+            return conditional_json(payload)
             
         except Exception as e:
             app.logger.error(f"Error fetching user feedback: {str(e)}")
             return jsonify({"error": "Failed to fetch feedback"}), 500
 
+    
+    @app.route("/api/users/<int:user_id>/feedback/summary", methods=["GET"])
+    @login_required
+    def get_user_feedback_summary(user_id):
+        """Get a user's average rating and review count"""
+        try:
+            cache_key = f"feedback-summary:{users_cache_version()}:{user_id}"
+            payload = cache_get(cache_key)
+            if payload is not None:
+                return conditional_json(payload)
+            
+            # Read the aggregates maintained on the user row
+            row = db.session.execute(
+                select(User.rating_sum, User.rating_count).where(User.id == user_id)
+            ).first()
+            if row is None:
+                app.logger.warning(f"Feedback summary failed: User {user_id} not found")
+                return jsonify({"error": "User not found"}), 404
+            
+            rating_sum, rating_count = row
+            payload = {
+                "user_id": user_id,
+                "average_rating": compute_average_rating(rating_sum, rating_count),
+                "total_reviews": rating_count,
+            }
+            cache_set(cache_key, payload)
+            
+            return conditional_json(payload)
+            
+        except Exception as e:
+            app.logger.error(f"Error fetching feedback summary: {str(e)}")
+            return jsonify({"error": "Failed to fetch feedback summary"}), 500
+
 
 # APPLICATION ENTRY POINT
 
@@ -28,6 +28,9 @@ class Config:
     # Password requirements
     PASSWORD_MIN_LENGTH = int(os.getenv("PASSWORD_MIN_LENGTH", "8"))
     
+    # Password hashing method passed to Werkzeug (scrypt:N:r:p or pbkdf2:sha256:iterations)
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+    
     # =====================================
     # DATABASE SETTINGS
     # =====================================
@@ -50,7 +53,12 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
     # Database connection pool settings
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    
     SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': DB_POOL_SIZE,          # Persistent connections kept open
+        'max_overflow': DB_MAX_OVERFLOW,    # Extra connections allowed under burst load
         'pool_pre_ping': True,  # Verify connections before using
         'pool_recycle': 3600,   # Recycle connections after 1 hour
     }
@@ -68,6 +76,29 @@ class Config:
     SESSION_COOKIE_SAMESITE = "Lax"  # CSRF protection
     PERMANENT_SESSION_LIFETIME = 86400  # 24 hours
     
+    # Browser cache lifetime for frontend assets (seconds); also used by
+    # Flask's built-in static route, which serves files under frontend/
+    STATIC_MAX_AGE = int(os.getenv("STATIC_MAX_AGE", "3600"))
+    SEND_FILE_MAX_AGE_DEFAULT = STATIC_MAX_AGE
+    
+    # Flask-Compress rewrites ETags to "<etag>:gzip" after the view runs, so it
+    # must re-check If-None-Match itself for compressed responses to get 304s
+    COMPRESS_EVALUATE_CONDITIONAL_REQUEST = True
+    
+    # =====================================
+    # CACHE SETTINGS
+    # =====================================
+    
+    # SimpleCache is per-process: with more than one worker process (e.g.
+    # gunicorn -w 2) use CACHE_TYPE=RedisCache, or workers serve each other's
+    # stale entries after an update until their TTL runs out
+    CACHE_TYPE = os.getenv("CACHE_TYPE", "SimpleCache")
+    CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+    CACHE_DEFAULT_TIMEOUT = int(os.getenv("CACHE_DEFAULT_TIMEOUT", "30"))  # seconds
+    
+    # How long /api/health reuses its last database check (seconds; 0 disables caching)
+    HEALTH_CHECK_CACHE_TIMEOUT = int(os.getenv("HEALTH_CHECK_CACHE_TIMEOUT", "5"))
+    
     # =====================================
     # LOGGING SETTINGS
     # =====================================
@@ -92,8 +123,11 @@ if __name__ == "__main__":
     print(f"Database: {config.DB_NAME}")
     print(f"DB Host: {config.DB_HOST}:{config.DB_PORT}")
     print(f"DB User: {config.DB_USER}")
+    print(f"DB Pool: {config.DB_POOL_SIZE} (+{config.DB_MAX_OVERFLOW} overflow)")
     print(f"Environment: {config.FLASK_ENV}")
+    print(f"Cache: {config.CACHE_TYPE} ({config.CACHE_DEFAULT_TIMEOUT}s)")
     print(f"Debug: {config.DEBUG}")
     print(f"Password Min Length: {config.PASSWORD_MIN_LENGTH}")
+    print(f"Password Hash Method: {config.PASSWORD_HASH_METHOD}")
     print(f"Secret Key: {'*' * 20} (masked)")
     print("="*50 + "\n")
\ No newline at end of file
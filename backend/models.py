@@ -8,15 +8,63 @@ Tables:
 """
 
 from datetime import datetime
+from operator import attrgetter
 from flask_sqlalchemy import SQLAlchemy
 
 db = SQLAlchemy()
 
+# Column fields copied as-is by the to_dict helpers (datetimes are left to
+# the app's orjson provider, which writes them in ISO 8601 format)
+_USER_BASIC_FIELDS = ("id", "name", "email", "bio", "interests", "skills", "experience_years", "role", "created_at")
+_USER_COMPACT_FIELDS = ("id", "name", "role")
+_SESSION_FIELDS = (
+    "id", "topic", "description", "scheduled_time", "meeting_link", "status",
+    "created_at", "updated_at",
+)
+_FEEDBACK_FIELDS = ("id", "session_id", "rating", "comment", "created_at")
+
+# Fetch all of a tuple's fields in one C-level call
+_get_user_basic = attrgetter(*_USER_BASIC_FIELDS)
+_get_user_compact = attrgetter(*_USER_COMPACT_FIELDS)
+_get_session_fields = attrgetter(*_SESSION_FIELDS)
+_get_feedback_fields = attrgetter(*_FEEDBACK_FIELDS)
+
+
+def compute_average_rating(rating_sum, rating_count):
+    """Average feedback rating rounded to one decimal, or None if unrated"""
+    if not rating_count:
+        return None
+    return round(rating_sum / rating_count, 1)
+
+
+def _utcnow():
+    """Current UTC time in whole seconds, as stored by MySQL DATETIME"""
+    return datetime.utcnow().replace(microsecond=0)
+
+
+class UserRole:
+    """Constants for user roles"""
+    MENTOR = "mentor"
+    MENTEE = "mentee"
+    BOTH = "both"
+    
+    ALL = (MENTOR, MENTEE, BOTH)
+    CAN_MENTOR = (MENTOR, BOTH)  # Roles that can receive session requests
+
 
 class User(db.Model):
     """User model for mentors and mentees"""
     
     __tablename__ = "users"
+    __table_args__ = (
+        # Newest-first listing and keyset pagination on (created_at, id)
+        db.Index('ix_user_created', 'created_at', 'id'),
+        # Directory search (MATCH ... AGAINST) on MySQL; other databases use a
+        # LIKE scan, where a plain index over these TEXT columns would not help
+        db.Index(
+            'ft_user_search', 'name', 'interests', 'skills', mysql_prefix='FULLTEXT'
+        ).ddl_if(dialect='mysql'),
+    )
 
     # Primary fields
     id = db.Column(db.Integer, primary_key=True)
@@ -30,19 +78,24 @@ class User(db.Model):
     skills = db.Column(db.Text, nullable=True)     # Comma-separated
     experience_years = db.Column(db.Integer, nullable=True)  # Years of experience (mentors only)
     role = db.Column(
-        db.String(20), 
+        db.Enum(*UserRole.ALL, name="user_role"), 
         nullable=False, 
-        default="mentee"
+        default=UserRole.MENTEE,
+        index=True
     )  # mentor | mentee | both
     
+    # Rating aggregates, maintained incrementally when feedback is created
+    rating_sum = db.Column(db.Integer, default=0, server_default="0", nullable=False)
+    rating_count = db.Column(db.Integer, default=0, server_default="0", nullable=False)
+    
     # Metadata
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, default=_utcnow, nullable=False)
 
     # Relationships
     requested_sessions = db.relationship(
         "Session",
         foreign_keys="Session.requester_id",
-        backref="requester",
+        back_populates="requester",
         lazy=True,
         cascade="all, delete-orphan"
     )
@@ -50,7 +103,7 @@ class User(db.Model):
     mentor_sessions = db.relationship(
         "Session",
         foreign_keys="Session.mentor_id",
-        backref="mentor",
+        back_populates="mentor",
         lazy=True,
         cascade="all, delete-orphan"
     )
@@ -73,17 +126,16 @@ class User(db.Model):
 
     def to_dict_basic(self):
         """Convert user to dictionary (excludes password)"""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "email": self.email,
-            "bio": self.bio,
-            "interests": self.interests,
-            "skills": self.skills,
-            "experience_years": self.experience_years,
-            "role": self.role,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
+        return dict(zip(_USER_BASIC_FIELDS, _get_user_basic(self)))
+    
+    def to_dict_compact(self):
+        """Convert user to a minimal dictionary for embedding in other records"""
+        return dict(zip(_USER_COMPACT_FIELDS, _get_user_compact(self)))
+    
+    @property
+    def average_rating(self):
+        """Average feedback rating rounded to one decimal, or None if unrated"""
+        return compute_average_rating(self.rating_sum, self.rating_count)
     
     def __repr__(self):
         return f"<User {self.email} ({self.role})>"
@@ -101,20 +153,25 @@ class Session(db.Model):
     """Mentorship session model"""
     
     __tablename__ = "sessions"
+    __table_args__ = (
+        # Serve "my sessions" lookups ordered by created_at without a filesort
+        db.Index('ix_session_requester_created', 'requester_id', 'created_at'),
+        db.Index('ix_session_mentor_created', 'mentor_id', 'created_at'),
+        # Duplicate pending/accepted session check on create
+        db.Index('ix_session_dup', 'requester_id', 'mentor_id', 'topic', 'status'),
+    )
 
     # Primary fields
     id = db.Column(db.Integer, primary_key=True)
     requester_id = db.Column(
         db.Integer, 
         db.ForeignKey("users.id"), 
-        nullable=False,
-        index=True
+        nullable=False
     )
     mentor_id = db.Column(
         db.Integer, 
         db.ForeignKey("users.id"), 
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Session details
@@ -125,22 +182,40 @@ class Session(db.Model):
 
     # Status tracking
     status = db.Column(
-        db.String(20),
+        db.Enum(
+            SessionStatus.PENDING,
+            SessionStatus.ACCEPTED,
+            SessionStatus.REJECTED,
+            SessionStatus.COMPLETED,
+            name="session_status",
+        ),
         default=SessionStatus.PENDING,
         nullable=False,
         index=True,
     )
     
     # Metadata
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, default=_utcnow, nullable=False)
     updated_at = db.Column(
         db.DateTime, 
-        default=datetime.utcnow, 
-        onupdate=datetime.utcnow,
+        default=_utcnow, 
+        onupdate=_utcnow,
         nullable=False
     )
 
     # Relationships
+    requester = db.relationship(
+        "User",
+        foreign_keys=[requester_id],
+        back_populates="requested_sessions",
+    )
+    
+    mentor = db.relationship(
+        "User",
+        foreign_keys=[mentor_id],
+        back_populates="mentor_sessions",
+    )
+    
     feedback = db.relationship(
         "Feedback", 
         backref="session", 
@@ -150,18 +225,10 @@ class Session(db.Model):
 
     def to_dict(self):
         """Convert session to dictionary"""
-        return {
-            "id": self.id,
-            "requester": self.requester.to_dict_basic() if self.requester else None,
-            "mentor": self.mentor.to_dict_basic() if self.mentor else None,
-            "topic": self.topic,
-            "description": self.description,
-            "scheduled_time": self.scheduled_time.isoformat() if self.scheduled_time else None,
-            "meeting_link": self.meeting_link,
-            "status": self.status,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        data = dict(zip(_SESSION_FIELDS, _get_session_fields(self)))
+        data["requester"] = self.requester.to_dict_basic() if self.requester else None
+        data["mentor"] = self.mentor.to_dict_basic() if self.mentor else None
+        return data
     
     def __repr__(self):
         return f"<Session {self.id} ({self.status})>"
@@ -173,6 +240,9 @@ class Feedback(db.Model):
     __tablename__ = "feedback"
     __table_args__ = (
         db.UniqueConstraint('session_id', 'author_id', name='unique_feedback_per_session'),
+        # Newest-first feedback listing for a user
+        db.Index('ix_feedback_target_created', 'target_user_id', 'created_at'),
+        db.CheckConstraint('rating BETWEEN 1 AND 5', name='check_feedback_rating'),
     )
 
     # Primary fields
@@ -192,8 +262,7 @@ class Feedback(db.Model):
     target_user_id = db.Column(
         db.Integer, 
         db.ForeignKey("users.id"), 
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Feedback content
@@ -201,19 +270,14 @@ class Feedback(db.Model):
     comment = db.Column(db.Text, nullable=True)
     
     # Metadata
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, default=_utcnow, nullable=False)
 
     def to_dict(self):
         """Convert feedback to dictionary"""
-        return {
-            "id": self.id,
-            "session_id": self.session_id,
-            "author": self.author.to_dict_basic() if self.author else None,
-            "target_user": self.target_user.to_dict_basic() if self.target_user else None,
-            "rating": self.rating,
-            "comment": self.comment,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
+        data = dict(zip(_FEEDBACK_FIELDS, _get_feedback_fields(self)))
+        data["author"] = self.author.to_dict_compact() if self.author else None
+        data["target_user"] = self.target_user.to_dict_compact() if self.target_user else None
+        return data
     
     def __repr__(self):
         return f"<Feedback {self.id} (★{self.rating})>"
\ No newline at end of file